@@ -27,12 +27,13 @@ logger = logging.getLogger(__name__)
 class WikipediaClient:
     """Client for Wikipedia API with educational focus."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the Wikipedia client.
         
         Args:
             config: Application configuration
+            session: Optional shared HTTP session; the caller remains responsible for closing it
         """
         self.config = config
         self.base_url = config.apis.wikipedia.base_url
@@ -46,8 +47,9 @@ class WikipediaClient:
             'User-Agent': f'{config.server.name}/{config.server.version} (Educational MCP Server; https://github.com/openedu-mcp)'
         }
         
-        # Session will be created when needed
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Session will be created when needed unless a shared one is injected
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
@@ -57,11 +59,12 @@ class WikipediaClient:
                 headers=self.headers,
                 timeout=timeout
             )
+            self._owns_session = True
         return self._session
     
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
+        """Close the HTTP session if this client created it."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
     
     async def _make_request(
@@ -93,7 +96,13 @@ class WikipediaClient:
         session = await self._get_session()
         
         try:
-            async with session.get(url, params=params) as response:
+            # Headers and timeout are passed per request so a shared session gets them too
+            async with session.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data
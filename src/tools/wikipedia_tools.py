@@ -7,7 +7,7 @@ including educational filtering, content analysis, and article search functional
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, date
 
 import sys
@@ -26,6 +26,27 @@ from exceptions import ToolError, ValidationError, APIError
 
 logger = logging.getLogger(__name__)
 
+# Search terms used to widen queries for each educational subject
+_SUBJECT_SEARCH_TERMS: Dict[str, Tuple[str, ...]] = {
+    'Mathematics': ('mathematics', 'math', 'algebra', 'geometry', 'calculus', 'statistics'),
+    'Science': ('science', 'biology', 'chemistry', 'physics', 'astronomy', 'geology'),
+    'History': ('history', 'historical', 'ancient', 'medieval', 'civilization'),
+    'Literature': ('literature', 'poetry', 'novel', 'author', 'writer'),
+    'Geography': ('geography', 'country', 'continent', 'climate', 'region'),
+    'Arts': ('art', 'painting', 'sculpture', 'music', 'theater'),
+    'Technology': ('technology', 'computer', 'engineering', 'invention'),
+    'Social Studies': ('society', 'culture', 'government', 'politics', 'economics')
+}
+
+# Category keywords that mark a category as educational
+_EDUCATIONAL_CATEGORY_KEYWORDS = (
+    'education', 'science', 'mathematics', 'history', 'literature',
+    'learning', 'academic', 'research', 'study'
+)
+
+# Runs of capitalized words, used as candidate topic terms
+_CAPITALIZED_PHRASE_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
 
 class WikipediaTool(BaseTool):
     """Tool for Wikipedia API integration with educational features."""
@@ -457,7 +478,7 @@ class WikipediaTool(BaseTool):
             subject_terms = self._get_subject_search_terms(target_subject)
             subject_match = any(
                 term.lower() in content_text
-                for term in subject_terms + [target_subject]
+                for term in subject_terms + (target_subject,)
             )
             if subject_match:
                 score += 0.4
@@ -620,17 +641,14 @@ class WikipediaTool(BaseTool):
             # Filter for educational categories
             educational_cats = [
                 cat for cat in article.categories
-                if any(keyword in cat.lower() for keyword in [
-                    'education', 'science', 'mathematics', 'history', 'literature',
-                    'learning', 'academic', 'research', 'study'
-                ])
+                if any(keyword in cat.lower() for keyword in _EDUCATIONAL_CATEGORY_KEYWORDS)
             ]
             topics.extend(educational_cats[:5])
         
         # Extract key terms from content
         if article.content:
             # Simple keyword extraction (could be enhanced with NLP)
-            content_words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', article.content)
+            content_words = _CAPITALIZED_PHRASE_RE.findall(article.content)
             # Filter for likely educational terms
             educational_terms = [
                 term for term in content_words
@@ -642,20 +660,10 @@ class WikipediaTool(BaseTool):
         unique_topics = list(dict.fromkeys(topics))
         return unique_topics[:15]
     
-    def _get_subject_search_terms(self, subject: str) -> List[str]:
+    @staticmethod
+    def _get_subject_search_terms(subject: str) -> Tuple[str, ...]:
         """Get search terms for a specific educational subject."""
-        subject_terms = {
-            'Mathematics': ['mathematics', 'math', 'algebra', 'geometry', 'calculus', 'statistics'],
-            'Science': ['science', 'biology', 'chemistry', 'physics', 'astronomy', 'geology'],
-            'History': ['history', 'historical', 'ancient', 'medieval', 'civilization'],
-            'Literature': ['literature', 'poetry', 'novel', 'author', 'writer'],
-            'Geography': ['geography', 'country', 'continent', 'climate', 'region'],
-            'Arts': ['art', 'painting', 'sculpture', 'music', 'theater'],
-            'Technology': ['technology', 'computer', 'engineering', 'invention'],
-            'Social Studies': ['society', 'culture', 'government', 'politics', 'economics']
-        }
-        
-        return subject_terms.get(subject, [subject.lower()])
+        return _SUBJECT_SEARCH_TERMS.get(subject, (subject.lower(),))
     
     def _apply_educational_filters(
         self,
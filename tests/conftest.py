@@ -0,0 +1,45 @@
+"""
+Shared pytest configuration for the OpenEdu MCP Server test suite.
+"""
+
+import aiohttp
+import pytest
+
+# Import the modules under test once, before any test module is collected.
+# src/ is put on sys.path by the pythonpath setting in pyproject.toml.
+import config  # noqa: F401
+import exceptions  # noqa: F401
+import api.dictionary  # noqa: F401
+import api.openlibrary  # noqa: F401
+import models.base  # noqa: F401
+import models.book  # noqa: F401
+import models.definition  # noqa: F401
+import services.cache_service  # noqa: F401
+import services.rate_limiting_service  # noqa: F401
+import services.usage_service  # noqa: F401
+import tools.dictionary_tools  # noqa: F401
+import tools.openlibrary_tools  # noqa: F401
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+async def http_session():
+    """One pooled aiohttp session injected into the WikipediaClient tests."""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories():
+        """Run async tests on uvloop instead of the default selector loop.
+
+        The hook needs pytest-asyncio 1.4; it is deliberately not optional, so
+        an older pytest-asyncio fails loudly instead of silently skipping uvloop.
+        """
+        return {"uvloop": uvloop.new_event_loop}
@@ -5,15 +5,16 @@ This module contains comprehensive tests for the Wikipedia API integration,
 including educational filtering, content analysis, and error handling.
 """
 
+import functools
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 from datetime import datetime, date
-from typing import Dict, Any, List
+from types import SimpleNamespace
+from typing import Dict, Any, Final, List
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from tools.wikipedia_tools import WikipediaTool
 from api.wikipedia import WikipediaClient
@@ -23,70 +24,260 @@ from config import Config
 from exceptions import ToolError, ValidationError, APIError
 
 
+LONG_MATH_TEXT = " ".join(["Complex mathematical concepts and theoretical frameworks"] * 100)
+
+# Default metadata shared by sample articles that only pass through read-only helpers
+_EMPTY_META: Final = EducationalMetadata()
+
+# Canned Wikipedia API payloads and client results, shared read-only by the tests
+SEARCH_RESPONSE = {
+    "query": {
+        "search": [
+            {
+                "title": "Mathematics",
+                "snippet": "Mathematics is the study of numbers...",
+                "size": 50000,
+                "wordcount": 8000,
+                "timestamp": "2023-01-01T00:00:00Z",
+                "pageid": 12345
+            }
+        ]
+    }
+}
+
+SEARCH_SUMMARY_RESPONSE = {
+    "title": "Mathematics",
+    "extract": "Mathematics is the study of numbers, shapes, and patterns.",
+    "pageid": 12345
+}
+
+SCIENCE_SUMMARY_RESPONSE = {
+    "title": "Science",
+    "extract": "Science is a systematic enterprise...",
+    "pageid": 67890,
+    "fullurl": "https://en.wikipedia.org/wiki/Science"
+}
+
+BIOLOGY_CONTENT_RESPONSE = {
+    "query": {
+        "pages": {
+            "12345": {
+                "title": "Biology",
+                "extract": "Biology is the natural science...",
+                "pageid": 12345,
+                "fullurl": "https://en.wikipedia.org/wiki/Biology",
+                "categories": [
+                    {"title": "Category:Biology"},
+                    {"title": "Category:Life sciences"}
+                ],
+                "links": [
+                    {"title": "Cell biology"},
+                    {"title": "Genetics"}
+                ],
+                "images": [
+                    {"title": "File:DNA_structure.jpg"}
+                ]
+            }
+        }
+    }
+}
+
+FEATURED_RESPONSE = {
+    "tfa": {
+        "title": "Featured Article",
+        "extract": "This is today's featured article...",
+        "description": "A great article",
+        "content_urls": {
+            "desktop": {
+                "page": "https://en.wikipedia.org/wiki/Featured_Article"
+            }
+        }
+    }
+}
+
+IMAGES_RESPONSE = {
+    "query": {
+        "pages": {
+            "12345": {
+                "images": [
+                    {"title": "File:Example.jpg"},
+                    {"title": "File:Another.png"}
+                ]
+            }
+        }
+    }
+}
+
+IMAGE_INFO_RESPONSE = {
+    "query": {
+        "pages": {
+            "67890": {
+                "imageinfo": [{
+                    "url": "https://upload.wikimedia.org/wikipedia/commons/example.jpg",
+                    "width": 800,
+                    "height": 600,
+                    "mime": "image/jpeg"
+                }]
+            }
+        }
+    }
+}
+
+MATH_EDUCATION_SEARCH_RESULTS = [
+    {
+        "title": "Mathematics Education",
+        "snippet": "Mathematics education is the practice of teaching...",
+        "url": "https://en.wikipedia.org/wiki/Mathematics_Education",
+        "summary": "Mathematics education involves teaching mathematical concepts...",
+        "pageid": 12345
+    }
+]
+
+SCIENCE_SUMMARY = {
+    "title": "Science",
+    "extract": "Science is a systematic enterprise...",
+    "pageid": 67890
+}
+
+BIOLOGY_CONTENT = {
+    "title": "Biology",
+    "extract": "Biology is the natural science...",
+    "categories": ["Biology", "Life sciences"],
+    "links": ["Cell biology", "Genetics"]
+}
+
+BIOLOGY_IMAGES = [
+    {"url": "https://example.com/image1.jpg"},
+    {"url": "https://example.com/image2.jpg"}
+]
+
+FEATURED_ARTICLE = {
+    "title": "Featured Article",
+    "extract": "This is today's featured article...",
+    "date": "2023/01/01",
+    "type": "featured_article"
+}
+
+PHYSICS_SEARCH_RESULTS = [
+    {
+        "title": "Physics Concepts",
+        "snippet": "Physics is the natural science...",
+        "url": "https://en.wikipedia.org/wiki/Physics_Concepts",
+        "pageid": 54321
+    }
+]
+
+# Wikipedia page payloads for Article.from_wikipedia, keyed by fixture name
+_WIKI_FIXTURES = {
+    "test_article": {
+        "title": "Test Article",
+        "extract": "This is a test article about educational content.",
+        "pageid": 12345,
+        "fullurl": "https://en.wikipedia.org/wiki/Test_Article",
+        "categories": [
+            {"title": "Category:Education"},
+            {"title": "Category:Learning"}
+        ],
+        "links": ["Related Topic 1", "Related Topic 2"],
+        "timestamp": "2023-01-01T00:00:00Z"
+    }
+}
+
+
+@functools.cache
+def _article_fixture(key):
+    """Parse a _WIKI_FIXTURES payload once; callers must not mutate the result."""
+    return Article.from_wikipedia(_WIKI_FIXTURES[key])
+
+
+def async_return(value):
+    """Build a coroutine function that always returns value."""
+    async def _return(*args, **kwargs):
+        return value
+    return _return
+
+
+def async_seq(*values):
+    """Build a coroutine function that returns each value in turn."""
+    remaining = iter(values)
+    
+    async def _next(*args, **kwargs):
+        return next(remaining)
+    return _next
+
+
+def _set_requests(monkeypatch, client, *responses):
+    """Make client._make_request return each response in turn."""
+    monkeypatch.setattr(client, "_make_request", async_seq(*responses))
+    return client._make_request
+
+
+class _StubWikipediaClient:
+    """Stand-in for WikipediaClient exposing only the methods WikipediaTool calls."""
+    
+    def __init__(self):
+        self.search_wikipedia = AsyncMock()
+        self.get_article_summary = AsyncMock()
+        self.get_article_content = AsyncMock()
+        self.get_daily_featured = AsyncMock()
+        self.get_article_images = AsyncMock()
+        self.health_check = AsyncMock()
+    
+    def reset_mock(self, **kwargs):
+        """Reset every stubbed method, mirroring Mock.reset_mock."""
+        for method in vars(self).values():
+            method.reset_mock(**kwargs)
+
+
 class TestWikipediaClient:
     """Test cases for WikipediaClient."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Create a mock configuration."""
-        config = MagicMock()
-        
-        # Mock APIs configuration
-        config.apis = MagicMock()
-        config.apis.wikipedia = MagicMock()
-        config.apis.wikipedia.base_url = "https://en.wikipedia.org/api/rest_v1"
-        config.apis.wikipedia.timeout = 30
-        config.apis.wikipedia.retry_attempts = 2
-        config.apis.wikipedia.backoff_factor = 2.0
-        
-        # Mock server configuration
-        config.server = MagicMock()
-        config.server.name = "test-server"
-        config.server.version = "1.0.0"
+        wikipedia = SimpleNamespace(
+            base_url="https://en.wikipedia.org/api/rest_v1",
+            timeout=30,
+            retry_attempts=2,
+            backoff_factor=2.0
+        )
         
-        return config
+        return SimpleNamespace(
+            apis=SimpleNamespace(wikipedia=wikipedia),
+            server=SimpleNamespace(name="test-server", version="1.0.0")
+        )
     
-    @pytest.fixture
-    def wikipedia_client(self, mock_config):
-        """Create a WikipediaClient instance."""
-        return WikipediaClient(mock_config)
+    @pytest.fixture(scope="module")
+    def wikipedia_client(self, mock_config, http_session):
+        """Create a WikipediaClient instance shared across the module."""
+        return WikipediaClient(mock_config, session=http_session)
+    
+    @pytest.fixture(scope="module")
+    async def mock_http(self):
+        """Serve a local endpoint that echoes the User-Agent it receives."""
+        async def summary(request):
+            return web.json_response({
+                "title": "Science",
+                "user_agent": request.headers.get("User-Agent")
+            })
+        
+        app = web.Application()
+        app.router.add_get("/page/summary/Science", summary)
+        
+        async with TestServer(app) as server:
+            yield str(server.make_url("/page/summary/Science"))
     
-    @pytest.mark.asyncio
-    async def test_search_wikipedia_success(self, wikipedia_client):
+    async def test_search_wikipedia_success(self, wikipedia_client, monkeypatch):
         """Test successful Wikipedia search."""
-        mock_response = {
-            "query": {
-                "search": [
-                    {
-                        "title": "Mathematics",
-                        "snippet": "Mathematics is the study of numbers...",
-                        "size": 50000,
-                        "wordcount": 8000,
-                        "timestamp": "2023-01-01T00:00:00Z",
-                        "pageid": 12345
-                    }
-                ]
-            }
-        }
+        _set_requests(monkeypatch, wikipedia_client, SEARCH_RESPONSE, SEARCH_SUMMARY_RESPONSE)
+        
+        results = await wikipedia_client.search_wikipedia("mathematics", limit=1)
         
-        with patch.object(wikipedia_client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = [
-                mock_response,  # Search response
-                {  # Summary response
-                    "title": "Mathematics",
-                    "extract": "Mathematics is the study of numbers, shapes, and patterns.",
-                    "pageid": 12345
-                }
-            ]
-            
-            results = await wikipedia_client.search_wikipedia("mathematics", limit=1)
-            
-            assert len(results) == 1
-            assert results[0]["title"] == "Mathematics"
-            assert "snippet" in results[0]
-            assert "url" in results[0]
-    
-    @pytest.mark.asyncio
+        assert len(results) == 1
+        assert results[0]["title"] == "Mathematics"
+        assert "snippet" in results[0]
+        assert "url" in results[0]
+    
     async def test_search_wikipedia_validation_error(self, wikipedia_client):
         """Test search with invalid parameters."""
         with pytest.raises(ValidationError):
@@ -98,174 +289,116 @@ class TestWikipediaClient:
         with pytest.raises(ValidationError):
             await wikipedia_client.search_wikipedia("test", lang="invalid")
     
-    @pytest.mark.asyncio
-    async def test_get_article_summary_success(self, wikipedia_client):
+    async def test_get_article_summary_success(self, wikipedia_client, monkeypatch):
         """Test successful article summary retrieval."""
-        mock_response = {
-            "title": "Science",
-            "extract": "Science is a systematic enterprise...",
-            "pageid": 67890,
-            "fullurl": "https://en.wikipedia.org/wiki/Science"
-        }
+        _set_requests(monkeypatch, wikipedia_client, SCIENCE_SUMMARY_RESPONSE)
+        
+        result = await wikipedia_client.get_article_summary("Science")
         
-        with patch.object(wikipedia_client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-            
-            result = await wikipedia_client.get_article_summary("Science")
-            
-            assert result["title"] == "Science"
-            assert "extract" in result
-            assert result["pageid"] == 67890
-    
-    @pytest.mark.asyncio
-    async def test_get_article_content_success(self, wikipedia_client):
+        assert result["title"] == "Science"
+        assert "extract" in result
+        assert result["pageid"] == 67890
+    
+    async def test_get_article_content_success(self, wikipedia_client, monkeypatch):
         """Test successful article content retrieval."""
-        mock_response = {
-            "query": {
-                "pages": {
-                    "12345": {
-                        "title": "Biology",
-                        "extract": "Biology is the natural science...",
-                        "pageid": 12345,
-                        "fullurl": "https://en.wikipedia.org/wiki/Biology",
-                        "categories": [
-                            {"title": "Category:Biology"},
-                            {"title": "Category:Life sciences"}
-                        ],
-                        "links": [
-                            {"title": "Cell biology"},
-                            {"title": "Genetics"}
-                        ],
-                        "images": [
-                            {"title": "File:DNA_structure.jpg"}
-                        ]
-                    }
-                }
-            }
-        }
+        _set_requests(monkeypatch, wikipedia_client, BIOLOGY_CONTENT_RESPONSE)
         
-        with patch.object(wikipedia_client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-            
-            result = await wikipedia_client.get_article_content("Biology")
-            
-            assert result["title"] == "Biology"
-            assert "extract" in result
-            assert "categories" in result
-            assert len(result["categories"]) == 2
-            assert "Biology" in result["categories"]
-    
-    @pytest.mark.asyncio
-    async def test_get_daily_featured_success(self, wikipedia_client):
+        result = await wikipedia_client.get_article_content("Biology")
+        
+        assert result["title"] == "Biology"
+        assert "extract" in result
+        assert "categories" in result
+        assert len(result["categories"]) == 2
+        assert "Biology" in result["categories"]
+    
+    async def test_get_daily_featured_success(self, wikipedia_client, monkeypatch):
         """Test successful featured article retrieval."""
-        mock_response = {
-            "tfa": {
-                "title": "Featured Article",
-                "extract": "This is today's featured article...",
-                "description": "A great article",
-                "content_urls": {
-                    "desktop": {
-                        "page": "https://en.wikipedia.org/wiki/Featured_Article"
-                    }
-                }
-            }
-        }
+        _set_requests(monkeypatch, wikipedia_client, FEATURED_RESPONSE)
+        
+        result = await wikipedia_client.get_daily_featured()
         
-        with patch.object(wikipedia_client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-            
-            result = await wikipedia_client.get_daily_featured()
-            
-            assert result["title"] == "Featured Article"
-            assert result["type"] == "featured_article"
-            assert "extract" in result
-    
-    @pytest.mark.asyncio
-    async def test_get_article_images_success(self, wikipedia_client):
+        assert result["title"] == "Featured Article"
+        assert result["type"] == "featured_article"
+        assert "extract" in result
+    
+    async def test_get_article_images_success(self, wikipedia_client, monkeypatch):
         """Test successful article images retrieval."""
-        mock_images_response = {
-            "query": {
-                "pages": {
-                    "12345": {
-                        "images": [
-                            {"title": "File:Example.jpg"},
-                            {"title": "File:Another.png"}
-                        ]
-                    }
-                }
-            }
-        }
+        _set_requests(
+            monkeypatch,
+            wikipedia_client,
+            IMAGES_RESPONSE,
+            IMAGE_INFO_RESPONSE,
+            IMAGE_INFO_RESPONSE
+        )
         
-        mock_image_info_response = {
-            "query": {
-                "pages": {
-                    "67890": {
-                        "imageinfo": [{
-                            "url": "https://upload.wikimedia.org/wikipedia/commons/example.jpg",
-                            "width": 800,
-                            "height": 600,
-                            "mime": "image/jpeg"
-                        }]
-                    }
-                }
-            }
-        }
+        result = await wikipedia_client.get_article_images("Test Article")
+        
+        assert len(result) == 2
+        assert result[0]["title"] == "File:Example.jpg"
+        assert "url" in result[0]
+    
+    async def test_make_request_through_injected_session(
+        self, wikipedia_client, http_session, mock_http
+    ):
+        """Test that requests go out on the injected session, which close() leaves open."""
+        assert await wikipedia_client._get_session() is http_session
+        
+        result = await wikipedia_client._make_request(mock_http)
         
-        with patch.object(wikipedia_client, '_make_request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = [
-                mock_images_response,
-                mock_image_info_response,
-                mock_image_info_response
-            ]
-            
-            result = await wikipedia_client.get_article_images("Test Article")
-            
-            assert len(result) == 2
-            assert result[0]["title"] == "File:Example.jpg"
-            assert "url" in result[0]
-    
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, wikipedia_client):
+        assert result["title"] == "Science"
+        assert result["user_agent"] == wikipedia_client.headers["User-Agent"]
+        
+        await wikipedia_client.close()
+        
+        assert not http_session.closed
+    
+    async def test_health_check_success(self, wikipedia_client, monkeypatch):
         """Test successful health check."""
-        with patch.object(wikipedia_client, 'search_wikipedia', new_callable=AsyncMock) as mock_search:
-            mock_search.return_value = []
-            
-            result = await wikipedia_client.health_check()
-            
-            assert result["status"] == "healthy"
-            assert "response_time_seconds" in result
-            assert "timestamp" in result
-    
-    @pytest.mark.asyncio
-    async def test_health_check_failure(self, wikipedia_client):
+        monkeypatch.setattr(wikipedia_client, "search_wikipedia", async_return([]))
+        
+        result = await wikipedia_client.health_check()
+        
+        assert result["status"] == "healthy"
+        assert "response_time_seconds" in result
+        assert "timestamp" in result
+    
+    async def test_health_check_failure(self, wikipedia_client, monkeypatch):
         """Test health check failure."""
-        with patch.object(wikipedia_client, 'search_wikipedia', new_callable=AsyncMock) as mock_search:
-            mock_search.side_effect = APIError("Connection failed", "wikipedia")
-            
-            result = await wikipedia_client.health_check()
-            
-            assert result["status"] == "unhealthy"
-            assert "error" in result
+        monkeypatch.setattr(wikipedia_client, "search_wikipedia", AsyncMock(
+            side_effect=APIError("Connection failed", "wikipedia")
+        ))
+        
+        result = await wikipedia_client.health_check()
+        
+        assert result["status"] == "unhealthy"
+        assert "error" in result
 
 
 class TestWikipediaTool:
     """Test cases for WikipediaTool."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Create a mock configuration."""
-        config = MagicMock()
-        
-        # Mock education configuration
-        config.education = MagicMock()
-        config.education.content_filters = MagicMock()
-        config.education.content_filters.min_educational_relevance = 0.7
-        config.education.content_filters.enable_age_appropriate = True
-        config.education.content_filters.enable_curriculum_alignment = True
+        content_filters = SimpleNamespace(
+            min_educational_relevance=0.7,
+            enable_age_appropriate=True,
+            enable_curriculum_alignment=True
+        )
+        wikipedia = SimpleNamespace(
+            base_url="https://en.wikipedia.org/api/rest_v1",
+            timeout=30,
+            retry_attempts=2,
+            backoff_factor=2.0
+        )
         
-        return config
+        return SimpleNamespace(
+            education=SimpleNamespace(content_filters=content_filters),
+            apis=SimpleNamespace(wikipedia=wikipedia),
+            server=SimpleNamespace(name="test-server", version="1.0.0")
+        )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_services(self):
         """Create mock services."""
         cache_service = AsyncMock()
@@ -273,152 +406,171 @@ class TestWikipediaTool:
         usage_service = AsyncMock()
         return cache_service, rate_limiting_service, usage_service
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def wikipedia_tool(self, mock_config, mock_services):
-        """Create a WikipediaTool instance."""
+        """Create a WikipediaTool instance shared across the module."""
         cache_service, rate_limiting_service, usage_service = mock_services
         tool = WikipediaTool(mock_config, cache_service, rate_limiting_service, usage_service)
-        tool.client = AsyncMock(spec=WikipediaClient)
+        tool.client = _StubWikipediaClient()
         return tool
     
-    @pytest.mark.asyncio
-    async def test_search_educational_articles_success(self, wikipedia_tool):
+    @pytest.fixture(scope="module")
+    def sample_articles(self):
+        """Articles shared read-only by the analysis and filtering tests."""
+        return {
+            "math_education_research": Article(
+                title="Mathematics Education Research",
+                url="https://example.com",
+                summary="This article discusses educational research in mathematics teaching and learning.",
+                categories=["Education", "Mathematics", "Research"],
+                educational_metadata=_EMPTY_META
+            ),
+            "simple_math": Article(
+                title="Simple Math",
+                url="https://example.com",
+                summary="Math is fun. Numbers are everywhere. We use math daily.",
+                educational_metadata=_EMPTY_META
+            ),
+            "long_math": Article(
+                title="Advanced Mathematics",
+                url="https://example.com",
+                summary=LONG_MATH_TEXT,
+                educational_metadata=_EMPTY_META
+            ),
+            "basic_addition": Article(
+                title="Basic Addition",
+                url="https://example.com",
+                summary="Addition is putting numbers together. 1 + 1 = 2.",
+                educational_metadata=_EMPTY_META
+            ),
+            "scientific_method": Article(
+                title="Scientific Method",
+                url="https://example.com",
+                summary="The scientific method involves hypothesis testing and inquiry-based learning.",
+                educational_metadata=_EMPTY_META
+            ),
+            "biology_education": Article(
+                title="Biology Education",
+                url="https://example.com",
+                summary="Biology education involves teaching about cells, genetics, and evolution.",
+                categories=["Biology", "Education", "Life Sciences"],
+                content="Students learn about DNA, proteins, and cellular processes.",
+                educational_metadata=_EMPTY_META
+            ),
+            "high_relevance": Article(
+                title="High Relevance Article",
+                url="https://example.com/1",
+                summary="Educational content about mathematics teaching.",
+                educational_metadata=EducationalMetadata(
+                    educational_relevance_score=0.9,
+                    grade_levels=[GradeLevel.GRADES_6_8],
+                    educational_subjects=["Mathematics"]
+                )
+            ),
+            "low_relevance": Article(
+                title="Low Relevance Article",
+                url="https://example.com/2",
+                summary="Random content not related to education.",
+                educational_metadata=EducationalMetadata(
+                    educational_relevance_score=0.3,
+                    grade_levels=[GradeLevel.COLLEGE],
+                    educational_subjects=["Other"]
+                )
+            ),
+        }
+    
+    @pytest.fixture
+    def monitored(self, wikipedia_tool):
+        """Replace execute_with_monitoring on the shared tool with an AsyncMock."""
+        mock_execute = AsyncMock()
+        wikipedia_tool.execute_with_monitoring = mock_execute
+        yield mock_execute
+        del wikipedia_tool.execute_with_monitoring
+    
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, wikipedia_tool, mock_services):
+        """Clear return values, side effects and calls on the shared mocks."""
+        yield
+        wikipedia_tool.client.reset_mock(return_value=True, side_effect=True)
+        for service in mock_services:
+            service.reset_mock(return_value=True, side_effect=True)
+    
+    async def test_search_educational_articles_success(self, wikipedia_tool, monitored):
         """Test successful educational article search."""
-        mock_search_results = [
-            {
-                "title": "Mathematics Education",
-                "snippet": "Mathematics education is the practice of teaching...",
-                "url": "https://en.wikipedia.org/wiki/Mathematics_Education",
-                "summary": "Mathematics education involves teaching mathematical concepts...",
-                "pageid": 12345
-            }
-        ]
+        wikipedia_tool.client.search_wikipedia.return_value = MATH_EDUCATION_SEARCH_RESULTS
         
-        wikipedia_tool.client.search_wikipedia.return_value = mock_search_results
-        
-        with patch.object(wikipedia_tool, 'execute_with_monitoring', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = [{"title": "Mathematics Education", "educational_score": 0.8}]
-            
-            result = await wikipedia_tool.search_educational_articles(
-                query="mathematics education",
-                subject="Mathematics",
-                grade_level="6-8",
-                limit=5
-            )
-            
-            assert len(result) == 1
-            assert result[0]["title"] == "Mathematics Education"
-            mock_execute.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_get_article_summary_success(self, wikipedia_tool):
+        monitored.return_value = [{"title": "Mathematics Education", "educational_score": 0.8}]
+        
+        result = await wikipedia_tool.search_educational_articles(
+            query="mathematics education",
+            subject="Mathematics",
+            grade_level="6-8",
+            limit=5
+        )
+        
+        assert len(result) == 1
+        assert result[0]["title"] == "Mathematics Education"
+        monitored.assert_called_once()
+    
+    async def test_get_article_summary_success(self, wikipedia_tool, monitored):
         """Test successful article summary retrieval."""
-        mock_summary = {
-            "title": "Science",
-            "extract": "Science is a systematic enterprise...",
-            "pageid": 67890
-        }
+        wikipedia_tool.client.get_article_summary.return_value = SCIENCE_SUMMARY
+        
+        monitored.return_value = {"title": "Science", "educational_score": 0.9}
         
-        wikipedia_tool.client.get_article_summary.return_value = mock_summary
+        result = await wikipedia_tool.get_article_summary("Science")
         
-        with patch.object(wikipedia_tool, 'execute_with_monitoring', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = {"title": "Science", "educational_score": 0.9}
-            
-            result = await wikipedia_tool.get_article_summary("Science")
-            
-            assert result["title"] == "Science"
-            mock_execute.assert_called_once()
+        assert result["title"] == "Science"
+        monitored.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_get_article_content_success(self, wikipedia_tool):
+    async def test_get_article_content_success(self, wikipedia_tool, monitored):
         """Test successful article content retrieval."""
-        mock_content = {
-            "title": "Biology",
-            "extract": "Biology is the natural science...",
-            "categories": ["Biology", "Life sciences"],
-            "links": ["Cell biology", "Genetics"]
-        }
+        wikipedia_tool.client.get_article_content.return_value = BIOLOGY_CONTENT
+        wikipedia_tool.client.get_article_images.return_value = BIOLOGY_IMAGES
         
-        mock_images = [
-            {"url": "https://example.com/image1.jpg"},
-            {"url": "https://example.com/image2.jpg"}
-        ]
+        monitored.return_value = {"title": "Biology", "multimedia_resources": ["https://example.com/image1.jpg"]}
         
-        wikipedia_tool.client.get_article_content.return_value = mock_content
-        wikipedia_tool.client.get_article_images.return_value = mock_images
+        result = await wikipedia_tool.get_article_content("Biology", include_images=True)
         
-        with patch.object(wikipedia_tool, 'execute_with_monitoring', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = {"title": "Biology", "multimedia_resources": ["https://example.com/image1.jpg"]}
-            
-            result = await wikipedia_tool.get_article_content("Biology", include_images=True)
-            
-            assert result["title"] == "Biology"
-            mock_execute.assert_called_once()
+        assert result["title"] == "Biology"
+        monitored.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_get_featured_article_success(self, wikipedia_tool):
+    async def test_get_featured_article_success(self, wikipedia_tool, monitored):
         """Test successful featured article retrieval."""
-        mock_featured = {
+        wikipedia_tool.client.get_daily_featured.return_value = FEATURED_ARTICLE
+        
+        monitored.return_value = {
             "title": "Featured Article",
-            "extract": "This is today's featured article...",
-            "date": "2023/01/01",
-            "type": "featured_article"
+            "featured_date": "2023/01/01",
+            "featured_type": "featured_article"
         }
         
-        wikipedia_tool.client.get_daily_featured.return_value = mock_featured
+        result = await wikipedia_tool.get_featured_article("2023/01/01")
         
-        with patch.object(wikipedia_tool, 'execute_with_monitoring', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = {
-                "title": "Featured Article",
-                "featured_date": "2023/01/01",
-                "featured_type": "featured_article"
-            }
-            
-            result = await wikipedia_tool.get_featured_article("2023/01/01")
-            
-            assert result["title"] == "Featured Article"
-            assert result["featured_date"] == "2023/01/01"
-            mock_execute.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_get_articles_by_subject_success(self, wikipedia_tool):
+        assert result["title"] == "Featured Article"
+        assert result["featured_date"] == "2023/01/01"
+        monitored.assert_called_once()
+    
+    async def test_get_articles_by_subject_success(self, wikipedia_tool, monitored):
         """Test successful subject-based article search."""
-        mock_search_results = [
-            {
-                "title": "Physics Concepts",
-                "snippet": "Physics is the natural science...",
-                "url": "https://en.wikipedia.org/wiki/Physics_Concepts",
-                "pageid": 54321
-            }
-        ]
+        wikipedia_tool.client.search_wikipedia.return_value = PHYSICS_SEARCH_RESULTS
         
-        wikipedia_tool.client.search_wikipedia.return_value = mock_search_results
-        
-        with patch.object(wikipedia_tool, 'execute_with_monitoring', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = [{"title": "Physics Concepts", "subject": "Science"}]
-            
-            result = await wikipedia_tool.get_articles_by_subject(
-                subject="Science",
-                grade_level="9-12",
-                limit=5
-            )
-            
-            assert len(result) == 1
-            assert result[0]["title"] == "Physics Concepts"
-            mock_execute.assert_called_once()
-    
-    def test_calculate_educational_relevance(self, wikipedia_tool):
-        """Test educational relevance calculation."""
-        article = Article(
-            title="Mathematics Education Research",
-            url="https://example.com",
-            summary="This article discusses educational research in mathematics teaching and learning.",
-            categories=["Education", "Mathematics", "Research"],
-            educational_metadata=EducationalMetadata()
+        monitored.return_value = [{"title": "Physics Concepts", "subject": "Science"}]
+        
+        result = await wikipedia_tool.get_articles_by_subject(
+            subject="Science",
+            grade_level="9-12",
+            limit=5
         )
         
+        assert len(result) == 1
+        assert result[0]["title"] == "Physics Concepts"
+        monitored.assert_called_once()
+    
+    def test_calculate_educational_relevance(self, wikipedia_tool, sample_articles):
+        """Test educational relevance calculation."""
         score = wikipedia_tool._calculate_educational_relevance(
-            article, 
+            sample_articles["math_education_research"],
             target_subject="Mathematics",
             target_grade_level="6-8"
         )
@@ -426,44 +578,21 @@ class TestWikipediaTool:
         assert 0.0 <= score <= 1.0
         assert score > 0.5  # Should have high relevance due to educational keywords
     
-    def test_analyze_reading_level(self, wikipedia_tool):
+    @pytest.mark.parametrize("key,expected_level,expected_difficulty", [
+        ("simple_math", "Elementary", "Beginner"),  # Short article
+        ("long_math", "College", "Advanced"),  # Long article
+    ])
+    def test_analyze_reading_level(
+        self, wikipedia_tool, sample_articles, key, expected_level, expected_difficulty
+    ):
         """Test reading level analysis."""
-        # Short article
-        short_article = Article(
-            title="Simple Math",
-            url="https://example.com",
-            summary="Math is fun. Numbers are everywhere. We use math daily.",
-            educational_metadata=EducationalMetadata()
-        )
-        
-        analysis = wikipedia_tool._analyze_reading_level(short_article)
-        assert analysis["level"] == "Elementary"
-        assert analysis["difficulty"] == "Beginner"
-        
-        # Long article
-        long_content = " ".join(["Complex mathematical concepts and theoretical frameworks"] * 100)
-        long_article = Article(
-            title="Advanced Mathematics",
-            url="https://example.com",
-            summary=long_content,
-            educational_metadata=EducationalMetadata()
-        )
-        
-        analysis = wikipedia_tool._analyze_reading_level(long_article)
-        assert analysis["level"] == "College"
-        assert analysis["difficulty"] == "Advanced"
+        analysis = wikipedia_tool._analyze_reading_level(sample_articles[key])
+        assert analysis["level"] == expected_level
+        assert analysis["difficulty"] == expected_difficulty
     
-    def test_determine_grade_levels(self, wikipedia_tool):
+    def test_determine_grade_levels(self, wikipedia_tool, sample_articles):
         """Test grade level determination."""
-        # Elementary level article
-        elementary_article = Article(
-            title="Basic Addition",
-            url="https://example.com",
-            summary="Addition is putting numbers together. 1 + 1 = 2.",
-            educational_metadata=EducationalMetadata()
-        )
-        
-        grade_levels = wikipedia_tool._determine_grade_levels(elementary_article)
+        grade_levels = wikipedia_tool._determine_grade_levels(sample_articles["basic_addition"])
         assert GradeLevel.K_2 in grade_levels
         assert GradeLevel.GRADES_3_5 in grade_levels
     
@@ -479,32 +608,18 @@ class TestWikipediaTool:
         assert "Mathematics" in enhanced
         assert len(enhanced) <= 5
     
-    def test_analyze_curriculum_alignment(self, wikipedia_tool):
+    def test_analyze_curriculum_alignment(self, wikipedia_tool, sample_articles):
         """Test curriculum alignment analysis."""
-        article = Article(
-            title="Scientific Method",
-            url="https://example.com",
-            summary="The scientific method involves hypothesis testing and inquiry-based learning.",
-            educational_metadata=EducationalMetadata()
+        alignment = wikipedia_tool._analyze_curriculum_alignment(
+            sample_articles["scientific_method"], "Science"
         )
         
-        alignment = wikipedia_tool._analyze_curriculum_alignment(article, "Science")
-        
         # Should detect NGSS alignment due to scientific method keywords
         assert isinstance(alignment, list)
     
-    def test_extract_educational_topics(self, wikipedia_tool):
+    def test_extract_educational_topics(self, wikipedia_tool, sample_articles):
         """Test educational topic extraction."""
-        article = Article(
-            title="Biology Education",
-            url="https://example.com",
-            summary="Biology education involves teaching about cells, genetics, and evolution.",
-            categories=["Biology", "Education", "Life Sciences"],
-            content="Students learn about DNA, proteins, and cellular processes.",
-            educational_metadata=EducationalMetadata()
-        )
-        
-        topics = wikipedia_tool._extract_educational_topics(article)
+        topics = wikipedia_tool._extract_educational_topics(sample_articles["biology_education"])
         
         assert len(topics) > 0
         assert len(topics) <= 15
@@ -526,56 +641,20 @@ class TestWikipediaTool:
         unknown_terms = wikipedia_tool._get_subject_search_terms("Unknown Subject")
         assert "unknown subject" in unknown_terms
     
-    def test_apply_educational_filters(self, wikipedia_tool):
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"min_relevance_score": 0.7}, id="relevance"),
+        pytest.param({"grade_level": GradeLevel.GRADES_6_8}, id="grade_level"),
+        pytest.param({"subject": "Mathematics"}, id="subject"),
+    ])
+    def test_apply_educational_filters(self, wikipedia_tool, sample_articles, kwargs):
         """Test educational filtering."""
-        articles = [
-            Article(
-                title="High Relevance Article",
-                url="https://example.com/1",
-                summary="Educational content about mathematics teaching.",
-                educational_metadata=EducationalMetadata(
-                    educational_relevance_score=0.9,
-                    grade_levels=[GradeLevel.GRADES_6_8],
-                    educational_subjects=["Mathematics"]
-                )
-            ),
-            Article(
-                title="Low Relevance Article",
-                url="https://example.com/2",
-                summary="Random content not related to education.",
-                educational_metadata=EducationalMetadata(
-                    educational_relevance_score=0.3,
-                    grade_levels=[GradeLevel.COLLEGE],
-                    educational_subjects=["Other"]
-                )
-            )
-        ]
+        articles = [sample_articles["high_relevance"], sample_articles["low_relevance"]]
         
-        # Filter by relevance
-        filtered = wikipedia_tool._apply_educational_filters(
-            articles,
-            min_relevance_score=0.7
-        )
-        assert len(filtered) == 1
-        assert filtered[0].title == "High Relevance Article"
+        filtered = wikipedia_tool._apply_educational_filters(articles, **kwargs)
         
-        # Filter by grade level
-        filtered = wikipedia_tool._apply_educational_filters(
-            articles,
-            grade_level=GradeLevel.GRADES_6_8
-        )
-        assert len(filtered) == 1
-        assert filtered[0].title == "High Relevance Article"
-        
-        # Filter by subject
-        filtered = wikipedia_tool._apply_educational_filters(
-            articles,
-            subject="Mathematics"
-        )
         assert len(filtered) == 1
         assert filtered[0].title == "High Relevance Article"
     
-    @pytest.mark.asyncio
     async def test_health_check_success(self, wikipedia_tool):
         """Test successful health check."""
         wikipedia_tool.client.health_check.return_value = {
@@ -591,7 +670,6 @@ class TestWikipediaTool:
         assert result["api_name"] == "wikipedia"
         assert "educational_features" in result
     
-    @pytest.mark.asyncio
     async def test_health_check_failure(self, wikipedia_tool):
         """Test health check failure."""
         wikipedia_tool.client.health_check.side_effect = Exception("Connection failed")
@@ -602,26 +680,13 @@ class TestWikipediaTool:
         assert "error" in result
 
 
+@pytest.mark.integration
 class TestWikipediaIntegration:
     """Integration tests for Wikipedia functionality."""
     
-    @pytest.mark.asyncio
     async def test_article_from_wikipedia_creation(self):
         """Test Article creation from Wikipedia data."""
-        wp_data = {
-            "title": "Test Article",
-            "extract": "This is a test article about educational content.",
-            "pageid": 12345,
-            "fullurl": "https://en.wikipedia.org/wiki/Test_Article",
-            "categories": [
-                {"title": "Category:Education"},
-                {"title": "Category:Learning"}
-            ],
-            "links": ["Related Topic 1", "Related Topic 2"],
-            "timestamp": "2023-01-01T00:00:00Z"
-        }
-        
-        article = Article.from_wikipedia(wp_data)
+        article = _article_fixture("test_article")
         
         assert article.title == "Test Article"
         assert article.source == "wikipedia"
@@ -630,7 +695,6 @@ class TestWikipediaIntegration:
         assert "Education" in article.categories
         assert article.educational_metadata.educational_relevance_score > 0
     
-    @pytest.mark.asyncio
     async def test_end_to_end_search_flow(self):
         """Test end-to-end search flow with mocked responses."""
         # This would be a more comprehensive integration test